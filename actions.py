@@ -2,9 +2,8 @@ from __future__ import annotations
 
 from typing import Optional, Tuple, TYPE_CHECKING
 
-import sys
-
 import color
+from components.fighter import CRITICAL_HIT
 import exceptions
 from equipment_slots import EquipmentSlot
 
@@ -14,22 +13,23 @@ if TYPE_CHECKING:
 
 
 class Action:
+    __slots__ = ("entity", "engine")
+
     def __init__(self, entity: Actor) -> None:
         super().__init__()
         self.entity = entity
+        self.engine: Engine = entity.parent.engine  # The engine this action belongs to
 
-    @property
-    def engine(self) -> Engine:
-        """Return the engine this action belongs to."""
-        return self.entity.parent.engine
-
-    def perform(self) -> None:
+    def perform(self) -> Optional[str]:
         """Perform this action with the objects needed to determine its scope.
 
         `self.engine` is the scope this action is being performed in.
 
         `self.entity` is the object performing the action.
 
+        Frequently failing actions, such as movement, return the reason they couldn't be performed
+        instead of raising `exceptions.Impossible`, so AI turns don't pay for an exception.
+
         This method must be overridden by Action subclasses.
         """
         raise NotImplementedError()
@@ -38,29 +38,31 @@ class Action:
 class PickupAction(Action):
     """Pick up an item and add it to the inventory, if there is room for it."""
 
+    __slots__ = ()
+
     def __init__(self, entity: Actor):
         super().__init__(entity)
 
-    def perform(self) -> None:
-        actor_location_x, actor_location_y = self.entity.x, self.entity.y
+    def perform(self) -> Optional[str]:
         inventory = self.entity.inventory
 
-        for item in self.engine.game_map.items:
-            if actor_location_y == item.y and actor_location_x == item.x:
-                if len(inventory.items) >= inventory.capacity:
-                    raise exceptions.Impossible("Your inventory is full.")
+        for item in self.engine.game_map.get_items_at_location(self.entity.x, self.entity.y):
+            if len(inventory.items) >= inventory.capacity:
+                return "Your inventory is full."
 
-                self.engine.game_map.entities.remove(item)
-                item.parent = self.entity.inventory
-                inventory.add_item(item)
+            self.engine.game_map.remove_entity(item)
+            item.parent = self.entity.inventory
+            inventory.add_item(item)
 
-                self.engine.message_log.add_message(f"You picked up the {item.name}!")
-                return
+            self.engine.message_log.add_message(f"You picked up the {item.name}!")
+            return None
 
-        raise exceptions.Impossible("There is nothing here to pick up.")
+        return "There is nothing here to pick up."
 
 
 class ItemAction(Action):
+    __slots__ = ("item", "target_xy")
+
     def __init__(
         self, entity: Actor, item: Item, target_xy: Optional[Tuple[int, int]] = None
     ):
@@ -82,11 +84,15 @@ class ItemAction(Action):
 
 
 class DropItem(ItemAction):
+    __slots__ = ()
+
     def perform(self) -> None:
         self.entity.inventory.drop(self.item)
 
 
 class EquipAction(Action):
+    __slots__ = ("item", "slot")
+
     def __init__(self, entity: Actor, item: Item, slot: EquipmentSlot):
         super().__init__(entity)
 
@@ -101,11 +107,15 @@ class EquipAction(Action):
 
 
 class WaitAction(Action):
+    __slots__ = ()
+
     def perform(self) -> None:
         pass
 
 
 class TakeStairsAction(Action):
+    __slots__ = ()
+
     def perform(self) -> None:
         """
         Take the stairs, if any exist at the entity's location.
@@ -120,92 +130,107 @@ class TakeStairsAction(Action):
 
 
 class ActionWithDirection(Action):
+    __slots__ = ("dx", "dy", "dest_xy", "target_actor")
+
     def __init__(self, entity: Actor, dx: int, dy: int):
         super().__init__(entity)
 
         self.dx = dx
         self.dy = dy
-
-    @property
-    def dest_xy(self) -> Tuple[int, int]:
-        """Returns this action's destination."""
-        return self.entity.x + self.dx, self.entity.y + self.dy
+        # This action's destination and the actor standing there. Actions are performed
+        # right after they are created, so neither can have changed in between.
+        self.dest_xy: Tuple[int, int] = entity.x + dx, entity.y + dy
+        self.target_actor: Optional[Actor] = self.engine.game_map.get_actor_at_location(*self.dest_xy)
 
     @property
     def blocking_entity(self) -> Optional[Entity]:
         """Return the blocking entity at this action's destination."""
         return self.engine.game_map.get_blocking_entity_at_location(*self.dest_xy)
 
-    @property
-    def target_actor(self) -> Optional[Actor]:
-        """Return the actor at this action's destination."""
-        return self.engine.game_map.get_actor_at_location(*self.dest_xy)
-
-    def perform(self) -> None:
+    def perform(self) -> Optional[str]:
         raise NotImplementedError()
 
 
-class MeleeAction(ActionWithDirection):
-    def perform(self) -> None:
-        # TODO: Replace - roll for attack and damage
-        target = self.target_actor
-        if not target:
-            raise exceptions.Impossible("Nothing to attack.")
+def melee(action: ActionWithDirection) -> Optional[str]:
+    """Attack the actor at the action's destination.
+
+    Shared by MeleeAction and BumpAction, so bumping doesn't allocate a second action.
+    An attack always takes the turn, so unlike move this never returns a reason.
+    """
+    # TODO: Replace - roll for attack and damage
+    target = action.target_actor
+    if not target:
+        raise exceptions.Impossible("Nothing to attack.")
+
+    attack_desc = f"{action.entity.name.capitalize()} attacks {target.name}"
+
+    # Power sums the attacker's equipment bonuses, so only compute it once.
+    fighter = action.entity.fighter
+    power = fighter.power
+
+    attack = fighter.roll_weapon_attack()
+    if attack == CRITICAL_HIT:  # Critical hit, the attacker's power counts twice
+        attack_desc = f"{attack_desc} and critically hits"
+        power *= 2
+    else:
+        attack -= target.fighter.avoidance
+
+    damage = power - target.fighter.armor
+
+    attack_color = fighter.attack_color
+    if attack < 0:
+        action.engine.message_log.add_message(
+            f"{attack_desc} but misses.", attack_color
+        )
+    elif damage > 0:
+        action.engine.message_log.add_message(
+            f"{attack_desc} for {damage} hit points.", attack_color
+        )
+        target.fighter.hp -= damage
+    else:
+        action.engine.message_log.add_message(
+            f"{attack_desc} but does no damage.", attack_color
+        )
+    return None
+
+
+def move(action: ActionWithDirection) -> Optional[str]:
+    """Move the action's entity to its destination, or return why it is blocked."""
+    dest_x, dest_y = action.dest_xy
+    game_map = action.engine.game_map
+
+    if not (game_map.in_bounds(dest_x, dest_y) and game_map.walkable[dest_x, dest_y]):
+        # Destination is out of bounds or blocked by a tile.
+        return "That way is blocked."
+    if (dest_x, dest_y) in game_map.blocker_at:
+        # Destination is blocked by an entity.
+        return "That way is blocked."
+
+    action.entity.move(action.dx, action.dy)
+    return None
 
-        attack_desc = f"{self.entity.name.capitalize()} attacks {target.name}"
 
-        attack = self.entity.fighter.roll_weapon_attack()
-        if attack == sys.maxsize:  # Critical hit
-            attack_desc = f"{attack_desc} and critically hits"
-            damage = self.entity.fighter.power
-        else:
-            damage = 0
-            attack -= target.fighter.avoidance
+class MeleeAction(ActionWithDirection):
+    __slots__ = ()
 
-        damage += self.entity.fighter.power - target.fighter.armor
-
-        if self.entity is self.engine.player:
-            attack_color = color.player_atk
-        else:
-            attack_color = color.enemy_atk
-        if attack < 0:
-            self.engine.message_log.add_message(
-                f"{attack_desc} but misses.", attack_color
-            )
-        elif damage > 0:
-            self.engine.message_log.add_message(
-                f"{attack_desc} for {damage} hit points.", attack_color
-            )
-            target.fighter.hp -= damage
-        else:
-            self.engine.message_log.add_message(
-                f"{attack_desc} but does no damage.", attack_color
-            )
+    def perform(self) -> Optional[str]:
+        return melee(self)
 
 
 class MovementAction(ActionWithDirection):
+    __slots__ = ()
 
-    def perform(self) -> None:
-        dest_x, dest_y = self.dest_xy
-
-        if not self.engine.game_map.in_bounds(dest_x, dest_y):
-            # Destination is out of bounds.
-            raise exceptions.Impossible("That way is blocked.")
-        if not self.engine.game_map.tiles["walkable"][dest_x, dest_y]:
-            # Destination is blocked by a tile.
-            raise exceptions.Impossible("That way is blocked.")
-        if self.engine.game_map.get_blocking_entity_at_location(dest_x, dest_y):
-            # Destination is blocked by an entity.
-            raise exceptions.Impossible("That way is blocked.")
-
-        self.entity.move(self.dx, self.dy)
+    def perform(self) -> Optional[str]:
+        return move(self)
 
 
 class BumpAction(ActionWithDirection):
-    def perform(self) -> None:
+    __slots__ = ()
+
+    def perform(self) -> Optional[str]:
         if self.target_actor:
             # TODO: Replace - transition into instanced combat
-            return MeleeAction(self.entity, self.dx, self.dy).perform()
+            return melee(self)
 
         else:
-            return MovementAction(self.entity, self.dx, self.dy).perform()
+            return move(self)
@@ -6,15 +6,32 @@ from typing import List, Optional, Tuple, TYPE_CHECKING
 import numpy as np   # type: ignore
 import tcod
 
-from actions import Action, BumpAction, MeleeAction, MovementAction, WaitAction
+from actions import BumpAction, MeleeAction, MovementAction
 
 if TYPE_CHECKING:
+    from engine import Engine
     from entity import Actor
 
 
-class BaseAI(Action):
+class BaseAI:
+    """
+    Decides and performs an actor's action each turn.
+
+    AIs are created along with their actor, before it is placed on a map, so unlike actions they can't store
+    the engine when they're created. They look it up through their actor instead.
+    """
+
+    __slots__ = ("entity",)
+
+    def __init__(self, entity: Actor) -> None:
+        self.entity = entity
 
-    def perform(self) -> None:
+    @property
+    def engine(self) -> Engine:
+        """Return the engine this AI's actor belongs to."""
+        return self.entity.parent.engine
+
+    def perform(self) -> Optional[str]:
         raise NotImplementedError()
 
     def get_path_to(self, dest_x: int, dest_y: int) -> List[Tuple[int, int]]:
@@ -23,16 +40,16 @@ class BaseAI(Action):
         If there is no valid path then returns an empty list.
         """
         # Copy the walkable array.
-        cost = np.array(self.entity.parent.tiles["walkable"], dtype=np.int8)
+        cost = np.array(self.entity.parent.walkable, dtype=np.int8)
 
-        for entity in self.entity.parent.entities:
-            # Check that an entity blocks movement and the cost isn't zero (blocking).
-            if entity.blocks_movement and cost[entity.x, entity.y]:
+        for x, y in self.entity.parent.blocker_at:
+            # Check that the cost of the blocked position isn't zero (blocking).
+            if cost[x, y]:
                 # Add to the cost of a blocked position.
                 # A lower number means more enemies will crowd behind each other in
                 # hallways. A higher number means enemies will take longer paths in
                 # order to surround the player.
-                cost[entity.x, entity.y] += 10
+                cost[x, y] += 10
 
         # Create a graph from the cost array and pass that graph to a new pathfinder.
         graph = tcod.path.SimpleGraph(cost=cost, cardinal=2, diagonal=3)
@@ -53,6 +70,8 @@ class ConfusedEnemy(BaseAI):
     If an actor occupies a tile it is randomly moving into, it will attack.
     """
 
+    __slots__ = ("previous_ai", "turns_remaining")
+
     def __init__(
         self, entity: Actor, previous_ai: Optional[BaseAI], turns_remaining: int,
     ):
@@ -61,7 +80,7 @@ class ConfusedEnemy(BaseAI):
         self.previous_ai = previous_ai
         self.turns_remaining = turns_remaining
 
-    def perform(self) -> None:
+    def perform(self) -> Optional[str]:
         # Revert the AI back to the original state if the effect has run its course.
         if self.turns_remaining <= 0:
             self.engine.message_log.add_message(
@@ -91,17 +110,19 @@ class ConfusedEnemy(BaseAI):
 
 
 class HostileEnemy(BaseAI):
+    __slots__ = ("path",)
+
     def __init__(self, entity: Actor):
         super().__init__(entity)
         self.path: List[Tuple[int, int]] = []
 
-    def perform(self) -> None:
-        target = self.engine.player
-        dx = target.x - self.entity.x
-        dy = target.y - self.entity.y
-        distance = max(abs(dx), abs(dy))  # Chebyshev distance
-
+    def perform(self) -> Optional[str]:
         if self.engine.game_map.visible[self.entity.x, self.entity.y]:
+            target = self.engine.player
+            dx = target.x - self.entity.x
+            dy = target.y - self.entity.y
+            distance = max(abs(dx), abs(dy))  # Chebyshev distance
+
             if distance <= 1:
                 return MeleeAction(self.entity, dx, dy).perform()
 
@@ -113,4 +134,6 @@ class HostileEnemy(BaseAI):
                 self.entity, dest_x - self.entity.x, dest_y - self.entity.y,
             ).perform()
 
-        return WaitAction(self.entity).perform()
+        # Out of sight with nowhere to go, which is most enemies on most turns. Waiting does nothing,
+        # so don't build a WaitAction just to perform it.
+        return None
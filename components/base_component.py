@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-import random
+from functools import lru_cache
+from random import randint
+from typing import Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from engine import Engine
@@ -10,15 +10,27 @@ if TYPE_CHECKING:
     from game_map import GameMap
 
 
-def roll_dice(dice_string: str):
-    number_of_dice, dice_size = tuple(dice_string.split('d'))
+@lru_cache(maxsize=None)
+def parse_dice(dice_string: str) -> Tuple[int, int]:
+    """Split a dice string such as "2d6" into the number of dice and their size."""
+    number_of_dice, dice_size = dice_string.split('d')
+    return int(number_of_dice), int(dice_size)
+
+
+def roll_dice(dice_string: str) -> int:
+    number_of_dice, dice_size = parse_dice(dice_string)
+    if number_of_dice == 1:
+        # Most rolls are a single die, which doesn't need the loop.
+        return randint(1, dice_size)
     result = 0
-    for i in range(int(number_of_dice)):
-        result += random.randint(1, int(dice_size))
+    for _ in range(number_of_dice):
+        result += randint(1, dice_size)
     return result
 
 
 class BaseComponent:
+    __slots__ = ("parent",)
+
     parent: Entity  # Owning entity instance
 
     @property
@@ -19,6 +19,8 @@ if TYPE_CHECKING:
 
 
 class Consumable(BaseComponent):
+    __slots__ = ()
+
     parent: Item
 
     def get_action(self, consumer: Actor) -> Optional[ActionOrHandler]:
@@ -41,6 +43,8 @@ class Consumable(BaseComponent):
 
 
 class ConfusionConsumable(Consumable):
+    __slots__ = ("number_of_turns",)
+
     def __init__(self, number_of_turns: int):
         self.number_of_turns = number_of_turns
 
@@ -75,6 +79,8 @@ class ConfusionConsumable(Consumable):
 
 
 class FireballDamageConsumable(Consumable):
+    __slots__ = ("damage", "radius")
+
     def __init__(self, damage: int, radius: int):
         self.damage = damage
         self.radius = radius
@@ -95,21 +101,28 @@ class FireballDamageConsumable(Consumable):
         if not self.engine.game_map.visible[target_xy]:
             raise Impossible("You cannot target an area that you cannot see.")
 
-        targets_hit = False
-        for actor in self.engine.game_map.actors:
-            if actor.distance(*target_xy) <= self.radius:
-                self.engine.message_log.add_message(
-                    f"The {actor.name} is engulfed in a fiery explosion, taking {self.damage} damage!"
-                )
-                actor.fighter.take_damage(self.damage)
-                targets_hit = True
-
-        if not targets_hit:
+        # Collect every actor inside the blast before damaging any of them, comparing squared distances.
+        radius_sq = self.radius ** 2
+        targets = [
+            actor for actor in self.engine.game_map.actors if actor.distance_sq(*target_xy) <= radius_sq
+        ]
+
+        if not targets:
             raise Impossible("There are no targets in the radius.")
+
+        # Report every target in a single log entry, before any of them can die.
+        self.engine.message_log.add_message("\n".join(
+            f"The {actor.name} is engulfed in a fiery explosion, taking {self.damage} damage!"
+            for actor in targets
+        ))
+        for actor in targets:
+            actor.fighter.take_damage(self.damage)
         self.consume()
 
 
 class HealingConsumable(Consumable):
+    __slots__ = ("amount",)
+
     def __init__(self, amount: int):
         self.amount = amount
 
@@ -128,6 +141,8 @@ class HealingConsumable(Consumable):
 
 
 class ManaConsumable(Consumable):
+    __slots__ = ("amount",)
+
     def __init__(self, amount: int):
         self.amount = amount
 
@@ -146,6 +161,8 @@ class ManaConsumable(Consumable):
 
 
 class LightningDamageConsumable(Consumable):
+    __slots__ = ("damage", "maximum_range")
+
     def __init__(self, damage: int, maximum_range: int):
         self.damage = damage
         self.maximum_range = maximum_range
@@ -153,15 +170,16 @@ class LightningDamageConsumable(Consumable):
     def activate(self, action: actions.ItemAction) -> None:
         consumer = action.entity
         target = None
-        closest_distance = self.maximum_range + 1.0
+        # Compared as squared distances, which order actors the same way without a square root per actor.
+        closest_distance_sq = (self.maximum_range + 1) ** 2
 
         for actor in self.engine.game_map.actors:
             if actor is not consumer and self.parent.game_map.visible[actor.x, actor.y]:
-                distance = consumer.distance(actor.x, actor.y)
+                distance_sq = consumer.distance_sq(actor.x, actor.y)
 
-                if distance < closest_distance:
+                if distance_sq < closest_distance_sq:
                     target = actor
-                    closest_distance = distance
+                    closest_distance_sq = distance_sq
         if target:
             self.engine.message_log.add_message(
                 f"A lightning bolt strikes the {target.name} with a loud thunder, for {self.damage} damage!"
@@ -3,65 +3,79 @@ from __future__ import annotations
 from typing import Dict, List, Optional, TYPE_CHECKING
 
 from components.base_component import BaseComponent
-from components.equippable import Equippable
 from equipment_types import EquipmentType
 from equipment_slots import EquipmentSlot
 
 if TYPE_CHECKING:
     from entity import Actor, Item
 
+# The type of equipment each slot holds, indexed by the slot's value.
+SLOT_TYPES = (
+    EquipmentType.HEAD,     # HEAD
+    EquipmentType.ARMOR,    # ARMOR
+    EquipmentType.WEAPON,   # MAINHAND
+    EquipmentType.WEAPON,   # OFFHAND
+    EquipmentType.TRINKET,  # TRINKET1
+    EquipmentType.TRINKET,  # TRINKET2
+)
+# The padded "Slot:" label each line of list_equipped_items starts with, indexed by the slot's value.
+SLOT_LABELS = tuple(f"{slot.name.capitalize() + ':': <9} " for slot in EquipmentSlot)
+
 
 class Equipment(BaseComponent):
+    __slots__ = (
+        "items",
+        "_armor_bonus_total",
+        "_attack_bonus_total",
+        "_defense_bonus_total",
+        "_power_bonus_total",
+    )
+
     parent: Actor
 
-    def __init__(self, items: Optional[Dict[EquipmentSlot, Equippable]]):
-        self.items = {}
-        for slot in EquipmentSlot:
-            self.items[slot] = None
+    def __init__(self, items: Optional[Dict[EquipmentSlot, Item]]):
+        # The equipped item in each slot, indexed by the slot's value.
+        self.items: List[Optional[Item]] = [None] * len(EquipmentSlot)
 
         if items is not None:
-            for slot, item in items:
+            for slot, item in items.items():
                 self.items[slot] = item
 
+        # Bonus totals of the equipped items, kept up to date by equip_to_slot and unequip_from_slot
+        # so reading a bonus doesn't walk every slot.
+        self._armor_bonus_total = 0
+        self._attack_bonus_total = 0
+        self._defense_bonus_total = 0
+        self._power_bonus_total = 0
+        for item in self.items:
+            if item is not None:
+                self.add_bonuses(item, 1)
+
     @property
     def armor_bonus(self) -> int:
-        bonus = 0
-
-        for slot, item in self.items.items():
-            if item is not None and item.equippable is not None:
-                bonus += item.equippable.armor_bonus
-
-        return bonus
+        return self._armor_bonus_total
 
     @property
     def attack_bonus(self) -> int:
-        bonus = 0
-
-        for slot, item in self.items.items():
-            if item is not None and item.equippable is not None:
-                bonus += item.equippable.attack_bonus
-
-        return bonus
+        return self._attack_bonus_total
 
     @property
     def defense_bonus(self) -> int:
-        bonus = 0
-
-        for slot, item in self.items.items():
-            if item is not None and item.equippable is not None:
-                bonus += item.equippable.defense_bonus
-
-        return bonus
+        return self._defense_bonus_total
 
     @property
     def power_bonus(self) -> int:
-        bonus = 0
-
-        for slot, item in self.items.items():
-            if item is not None and item.equippable is not None:
-                bonus += item.equippable.power_bonus
-
-        return bonus
+        return self._power_bonus_total
+
+    def add_bonuses(self, item: Item, sign: int) -> None:
+        """Add (sign=1) or subtract (sign=-1) an item's bonuses to the equipment totals."""
+        equippable = item.equippable
+        if equippable is None:
+            return
+        self._armor_bonus_total += sign * equippable.armor_bonus
+        self._attack_bonus_total += sign * equippable.attack_bonus
+        self._defense_bonus_total += sign * equippable.defense_bonus
+        self._power_bonus_total += sign * equippable.power_bonus
 
     def item_is_equipped(self, slot: EquipmentSlot) -> bool:
         return self.items[slot] is not None
@@ -82,15 +96,19 @@ class Equipment(BaseComponent):
         if current_item is not None:
             self.unequip_from_slot(slot, add_message)
 
-        if self.parent.inventory.has_item(item):
-            self.parent.inventory.remove_item(item)
+        # remove_item does nothing for items that aren't in the inventory, so there's no need to
+        # scan the inventory with has_item first.
+        self.parent.inventory.remove_item(item)
 
+        equippable = item.equippable
         item.parent = self
         self.items[slot] = item
+        self.add_bonuses(item, 1)
+        self.parent.fighter.update_combat_stats()
 
         if (
                 slot == EquipmentSlot.MAINHAND and
-                item.equippable.two_handed and
+                equippable.two_handed and
                 self.items[EquipmentSlot.OFFHAND] is not None
         ):
             self.unequip_from_slot(EquipmentSlot.OFFHAND, add_message)
@@ -99,10 +117,13 @@ class Equipment(BaseComponent):
             self.equip_message(item.name)
 
     def unequip_from_slot(self, slot: EquipmentSlot, add_message: bool) -> None:
-        current_item = self.items.pop(slot)
+        current_item = self.items[slot]
         self.items[slot] = None
-        self.parent.inventory.add_item(current_item)
-        current_item.parent.parent = self.parent.inventory
+        self.add_bonuses(current_item, -1)
+        self.parent.fighter.update_combat_stats()
+        inventory = self.parent.inventory
+        inventory.add_item(current_item)
+        current_item.parent.parent = inventory
 
         if add_message:
             self.unequip_message(current_item.name)
@@ -113,26 +134,11 @@ class Equipment(BaseComponent):
         self.equip_to_slot(slot, item_to_equip, add_message)
 
     def list_equipped_items(self) -> List[str]:
-        result = []
-        for slot, item in sorted(self.items.items()):
-            if item is None:
-                name = "None"
-            else:
-                name = item.name
-            result.append(f"{slot.name.capitalize() + ':': <9} {name}")
-        return result
+        return [
+            label + ("None" if item is None else item.name)
+            for label, item in zip(SLOT_LABELS, self.items)
+        ]
 
     @staticmethod
     def get_slot_type(slot: EquipmentSlot) -> EquipmentType:
-        if slot == EquipmentSlot.MAINHAND:
-            return EquipmentType.WEAPON
-        elif slot == EquipmentSlot.OFFHAND:
-            return EquipmentType.WEAPON
-        elif slot == EquipmentSlot.ARMOR:
-            return EquipmentType.ARMOR
-        elif slot == EquipmentSlot.HEAD:
-            return EquipmentType.HEAD
-        elif slot == EquipmentSlot.TRINKET1:
-            return EquipmentType.TRINKET
-        elif slot == EquipmentSlot.TRINKET2:
-            return EquipmentType.TRINKET
+        return SLOT_TYPES[slot]
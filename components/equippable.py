@@ -11,6 +11,8 @@ if TYPE_CHECKING:
 
 
 class Equippable(BaseComponent):
+    __slots__ = ("equipment_type", "power_bonus", "armor_bonus", "attack_bonus", "defense_bonus")
+
     parent: Item
 
     def __init__(
@@ -30,6 +32,8 @@ class Equippable(BaseComponent):
 
 
 class Weapon(Equippable):
+    __slots__ = ("two_handed", "offhand", "min_damage", "max_damage", "weapon_type")
+
     def __init__(
             self,
             equipment_type: EquipmentType,
@@ -59,6 +63,8 @@ class Weapon(Equippable):
 
 
 class Armor(Equippable):
+    __slots__ = ("agility_penalty",)
+
     def __init__(
             self,
             equipment_type: EquipmentType,
@@ -80,6 +86,8 @@ class Armor(Equippable):
 
 
 class Dagger(Weapon):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(
             weapon_type=WeaponType.AGILITY,
@@ -92,6 +100,8 @@ class Dagger(Weapon):
 
 
 class ShortSword(Weapon):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(
             weapon_type=WeaponType.FINESSE,
@@ -103,10 +113,14 @@ class ShortSword(Weapon):
 
 
 class LeatherArmor(Armor):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(equipment_type=EquipmentType.ARMOR, armor_bonus=1)
 
 
 class ChainMail(Armor):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(equipment_type=EquipmentType.ARMOR, agility_penalty=1, armor_bonus=3)
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
+from random import randrange
 import sys
-from typing import TYPE_CHECKING
-
-import random
+from typing import Tuple, TYPE_CHECKING
 
 import color
 from components.base_component import BaseComponent, roll_dice
@@ -13,9 +12,35 @@ if TYPE_CHECKING:
     from entity import Actor
 
 BASE_AVOIDANCE = 10
+CRITICAL_HIT = sys.maxsize  # Attack roll result that always hits
 
 
 class Fighter(BaseComponent):
+    __slots__ = (
+        "strength",
+        "perseverance",
+        "_agility",
+        "_magic",
+        "hit_dice",
+        "max_hp",
+        "_hp",
+        "max_mana",
+        "_mana",
+        "_base_defense",
+        "_base_power",
+        "armor",
+        "power",
+        "weapon_attack_bonus",
+        "spell_attack_bonus",
+        "avoidance",
+        "weapon_crit_threshold",
+        "spell_crit_threshold",
+        "has_weapon_advantage",
+        "has_spell_advantage",
+        "proficiency",
+        "attack_color",
+    )
+
     parent: Actor
     """
     Strength - Affects damage with weapons and block amount with shields.
@@ -48,24 +73,33 @@ class Fighter(BaseComponent):
             spell_crit_threshold: int = 20,
             has_weapon_advantage: bool = False,
             has_spell_advantage: bool = False,
+            attack_color: Tuple[int, int, int] = color.enemy_atk,
     ):
         self.strength = strength
         self.perseverance = perseverance
-        self.agility = agility
-        self.magic = magic
+        self._agility = agility
+        self._magic = magic
         # self.max_hp = hp
         self.hit_dice = hit_dice
         self.max_hp = roll_dice(hit_dice) + self.perseverance // 2
         self._hp = self.max_hp
         self.max_mana = mana
         self._mana = mana
-        self.base_defense = base_defense
-        self.base_power = base_power
+        self._base_defense = base_defense
+        self._base_power = base_power
+        # Stats derived from the ones above and from equipment bonuses. update_combat_stats recalculates them
+        # whenever either changes, so attacks and the HUD read them as plain attributes.
+        self.armor = base_defense
+        self.power = base_power
+        self.weapon_attack_bonus = agility // 2
+        self.spell_attack_bonus = magic // 2
+        self.avoidance = BASE_AVOIDANCE + agility // 2
         self.weapon_crit_threshold = weapon_crit_threshold
         self.spell_crit_threshold = spell_crit_threshold
         self.has_weapon_advantage = has_weapon_advantage
         self.has_spell_advantage = has_spell_advantage
         self.proficiency = 1
+        self.attack_color = attack_color  # Color of this fighter's attack messages
 
     @property
     def hp(self) -> int:
@@ -86,47 +120,51 @@ class Fighter(BaseComponent):
         self._mana = max(0, min(value, self.max_mana))
 
     @property
-    def armor(self) -> int:
-        return self.base_defense + self.armor_bonus
+    def agility(self) -> int:
+        return self._agility
 
-    @property
-    def power(self) -> int:
-        return self.base_power + self.power_bonus
+    @agility.setter
+    def agility(self, value: int) -> None:
+        self._agility = value
+        self.update_combat_stats()
 
     @property
-    def armor_bonus(self) -> int:
-        if self.parent.equipment:
-            return self.parent.equipment.armor_bonus
-        else:
-            return 0
+    def magic(self) -> int:
+        return self._magic
 
-    @property
-    def power_bonus(self) -> int:
-        if self.parent.equipment:
-            return self.parent.equipment.power_bonus
-        else:
-            return 0
+    @magic.setter
+    def magic(self, value: int) -> None:
+        self._magic = value
+        self.update_combat_stats()
 
     @property
-    def weapon_attack_bonus(self) -> int:
-        bonus = self.agility // 2
-        if self.parent.equipment:
-            bonus += self.parent.equipment.attack_bonus
-        return bonus
+    def base_defense(self) -> int:
+        return self._base_defense
 
-    @property
-    def spell_attack_bonus(self) -> int:
-        bonus = self.magic // 2
-        if self.parent.equipment:
-            bonus += self.parent.equipment.attack_bonus
-        return bonus
+    @base_defense.setter
+    def base_defense(self, value: int) -> None:
+        self._base_defense = value
+        self.update_combat_stats()
 
     @property
-    def avoidance(self) -> int:
-        avoidance = BASE_AVOIDANCE + self.agility // 2
-        if self.parent.equipment:
-            avoidance += self.parent.equipment.defense_bonus
-        return avoidance
+    def base_power(self) -> int:
+        return self._base_power
+
+    @base_power.setter
+    def base_power(self, value: int) -> None:
+        self._base_power = value
+        self.update_combat_stats()
+
+    def update_combat_stats(self) -> None:
+        """Recalculate the derived combat stats, after a stat they use or the equipped items change."""
+        # Every Actor is given an Equipment component, so there's no need to check for one.
+        equipment = self.parent.equipment
+        agility_bonus = self._agility // 2
+        self.armor = self._base_defense + equipment.armor_bonus
+        self.power = self._base_power + equipment.power_bonus
+        self.weapon_attack_bonus = agility_bonus + equipment.attack_bonus
+        self.spell_attack_bonus = self._magic // 2 + equipment.attack_bonus
+        self.avoidance = BASE_AVOIDANCE + agility_bonus + equipment.defense_bonus
 
     def die(self) -> None:
         if self.engine.player is self.parent:
@@ -138,6 +176,7 @@ class Fighter(BaseComponent):
 
         self.parent.char = "%"
         self.parent.color = (191, 0, 0)
+        self.game_map.unblock(self.parent)
         self.parent.blocks_movement = False
         self.parent.ai = None
         self.parent.name = f"remains of {self.parent.name}"
@@ -148,32 +187,34 @@ class Fighter(BaseComponent):
         self.engine.player.level.add_xp(self.parent.level.xp_given)
 
     def heal(self, amount: int) -> int:
-        if self.hp == self.max_hp:
+        if self._hp == self.max_hp:
             return 0
 
-        new_hp_value = self.hp + amount
+        new_hp_value = self._hp + amount
 
         if new_hp_value > self.max_hp:
             new_hp_value = self.max_hp
 
-        amount_recovered = new_hp_value - self.hp
+        amount_recovered = new_hp_value - self._hp
 
-        self.hp = new_hp_value
+        # Already clamped to max_hp, and healing can't kill, so skip the hp setter.
+        self._hp = new_hp_value
 
         return amount_recovered
 
     def restore_mana(self, amount: int) -> int:
-        if self.mana == self.max_mana:
+        if self._mana == self.max_mana:
             return 0
 
-        new_mana_value = self.mana + amount
+        new_mana_value = self._mana + amount
 
         if new_mana_value > self.max_mana:
             new_mana_value = self.max_mana
 
-        amount_recovered = new_mana_value - self.mana
+        amount_recovered = new_mana_value - self._mana
 
-        self.mana = new_mana_value
+        # Already clamped to max_mana, so skip the mana setter.
+        self._mana = new_mana_value
 
         return amount_recovered
 
@@ -182,11 +223,14 @@ class Fighter(BaseComponent):
 
     @staticmethod
     def roll_attack(crit_threshold: int, attack_bonus: int, advantage: bool = False) -> int:
-        roll = random.randint(1, 20)
+        # randrange(1, 21) rolls a d20 without going through randint, which just calls randrange.
+        roll = randrange(1, 21)
         if advantage:
-            roll = max(roll, random.randint(1, 20))
+            second_roll = randrange(1, 21)
+            if second_roll > roll:
+                roll = second_roll
         if roll >= crit_threshold:
-            return sys.maxsize
+            return CRITICAL_HIT
         else:
             return roll + attack_bonus
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING
 
 from components.base_component import BaseComponent
 
@@ -11,11 +11,18 @@ MAX_STACK_SIZE = 99
 
 
 class Inventory(BaseComponent):
+    __slots__ = ("capacity", "items", "stacks_by_name", "_listed_items")
+
     parent: Actor
 
     def __init__(self, capacity: int):
         self.capacity = capacity
         self.items: List[List[Item]] = []
+        # The same stacks, grouped by the name of the items in them, so adding or removing an item
+        # only looks at stacks it could belong to.
+        self.stacks_by_name: Dict[str, List[List[Item]]] = {}
+        # The result of list_items, until the next item is added or removed.
+        self._listed_items: Optional[List[str]] = None
 
     def drop(self, item: Item) -> None:
         """
@@ -30,40 +37,60 @@ class Inventory(BaseComponent):
         """
         Removes an item from the inventory and restores it to the game map, at the player's current location.
         """
-        for stack in range(len(self.items)):
-            if item in self.items[stack]:
-                self.items[stack].remove(item)
+        stacks = self.stacks_by_name.get(item.name)
+        if stacks is None:
+            return None
+
+        for index, stack in enumerate(stacks):
+            if item in stack:
+                stack.remove(item)
+                self._listed_items = None
 
-                if len(self.items[stack]) == 0:
-                    del self.items[stack]
+                if len(stack) == 0:
+                    # Stacks are removed by identity, since two stacks of the same items could compare equal.
+                    del stacks[index]
+                    if not stacks:
+                        del self.stacks_by_name[item.name]
+                    del self.items[next(i for i, other in enumerate(self.items) if other is stack)]
 
                 break
 
     def add_item(self, item: Item) -> None:
         item.parent = self
+        self._listed_items = None
+        stacks = self.stacks_by_name.setdefault(item.name, [])
         if item.stackable:
-            for stack in self.items:
-                if item.name == stack[0].name and len(stack) < MAX_STACK_SIZE:
+            for stack in stacks:
+                if len(stack) < MAX_STACK_SIZE:
                     stack.append(item)
                     return None
 
         # Item is not stackable or can't fit in any existing stack
-        self.items.append([item])
+        stack = [item]
+        stacks.append(stack)
+        self.items.append(stack)
 
     def list_items(self) -> List[str]:
-        """Creates a list of the items in the inventory, with their amounts if stacked."""
-        result = []
+        """
+        Creates a list of the items in the inventory, with their amounts if stacked.
 
-        for stack in self.items:
-            if len(stack) == 1:
-                result.append(f"{stack[0].name}")
-            else:
-                result.append(f"{stack[0].name} (x{len(stack)})")
+        The inventory menu asks for this several times per frame, so the list is kept until the inventory changes.
+        Callers must not modify it.
+        """
+        if self._listed_items is None:
+            self._listed_items = [
+                stack[0].name if len(stack) == 1 else f"{stack[0].name} (x{len(stack)})"
+                for stack in self.items
+            ]
 
-        return result
+        return self._listed_items
 
     def has_item(self, item: Item) -> bool:
-        for stack in self.items:
+        stacks = self.stacks_by_name.get(item.name)
+        if stacks is None:
+            return False
+
+        for stack in stacks:
             if item in stack:
                 return True
         return False
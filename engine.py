@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import lzma
+import os
 import pickle
 from typing import List, Optional, TYPE_CHECKING
 
@@ -16,6 +17,25 @@ if TYPE_CHECKING:
     from entity import Actor
     from game_map import GameMap, GameWorld
 
+KEYBOARD_COMMANDS = (
+    "Use item from bags:              i",
+    "Drop item:                       d",
+    "Unequip item:                    u",
+    "Character information:           c",
+    "Expand message log:              v",
+    "Descend stairs:          shift + .",
+    "Movement:              Numpad keys",
+    "Wait:                     Numpad 5",
+)
+MAP_LEGEND = (
+    "@: Player / Trader",
+    ">: Stairs down",
+    "/: Weapon",
+    "[: Armor",
+    "!: Potion",
+    "~: Scroll",
+)
+
 
 class Engine:
     game_map: GameMap
@@ -33,32 +53,42 @@ class Engine:
         self.cutscene_skip = False
 
     def handle_enemy_turns(self) -> None:
-        for entity in set(self.game_map.actors) - {self.player}:
-            if entity.ai:
+        for entity in self.game_map.non_player_actors:
+            if entity.ai:  # Dead actors have no AI
                 try:
+                    # A returned reason for a failed action is ignored, just like exceptions.
                     entity.ai.perform()
                 except exceptions.Impossible:
                     pass  # Ignore impossible action exceptions from AI.
 
     def save_as(self, filename: str) -> None:
         """Save this Engine instance as a compressed file."""
-        save_data = lzma.compress(pickle.dumps(self))
-        with open(filename, "wb") as f:
-            f.write(save_data)
+        # Stream the pickle through the compressor, instead of holding both the pickled and the compressed bytes
+        # in memory. Preset 1 compresses several times faster than the default, for a slightly larger file.
+        # The stream goes to a temporary file first, so a save that fails partway leaves the last good save intact.
+        temp_filename = filename + ".tmp"
+        with lzma.open(temp_filename, "wb", preset=1) as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_filename, filename)
 
     def render(self, console: Console):
+        # The screen is split into thirds: the map and the message log on top, the HUD panels below.
+        third_width = setup_game.WINDOW_WIDTH // 3
+        two_thirds_width = setup_game.WINDOW_WIDTH * 2 // 3
+        hud_y = setup_game.WINDOW_HEIGHT * 2 // 3
+
         self.message_log.render(
             console=console,
-            x=setup_game.WINDOW_WIDTH * 2 // 3 + 2,
+            x=two_thirds_width + 2,
             y=1,
-            width=setup_game.WINDOW_WIDTH // 3 - 2,
-            height=setup_game.WINDOW_HEIGHT * 2 // 3 - 1,
+            width=third_width - 2,
+            height=hud_y - 1,
         )
 
         render_functions.render_bars(
             console=console,
             player=self.player.fighter,
-            total_width=setup_game.WINDOW_WIDTH // 3 - 2,
+            total_width=third_width - 2,
         )
 
         if self.in_combat:
@@ -70,58 +100,28 @@ class Engine:
             render_functions.render_dungeon_level(
                 console=console,
                 dungeon_level=self.game_world.current_floor,
-                location=(1, setup_game.WINDOW_HEIGHT * 2 // 3 + 6)
+                location=(1, hud_y + 6)
             )
 
             render_functions.render_names_at_mouse_location(
-                console=console, x=0, y=setup_game.WINDOW_HEIGHT * 2 // 3 + 7, engine=self
-            )
-
-            frame_x = setup_game.WINDOW_WIDTH // 3 + 1
-            frame_y = setup_game.WINDOW_HEIGHT * 2 // 3 + 1
-            console.draw_frame(
-                x=frame_x,
-                y=frame_y,
-                width=setup_game.WINDOW_WIDTH // 3 - 1,
-                height=setup_game.WINDOW_HEIGHT // 3 - 2,
-                title="Keyboard Commands",
-                clear=True,
-                fg=(255, 255, 255),
-                bg=(0, 0, 0),
-            )
-
-            console.print(x=frame_x + 1, y=frame_y + 1, string="Use item from bags:              i")
-            console.print(x=frame_x + 1, y=frame_y + 2, string="Drop item:                       d")
-            console.print(x=frame_x + 1, y=frame_y + 3, string="Unequip item:                    u")
-            console.print(x=frame_x + 1, y=frame_y + 4, string="Character information:           c")
-            console.print(x=frame_x + 1, y=frame_y + 5, string="Expand message log:              v")
-            console.print(x=frame_x + 1, y=frame_y + 6, string="Descend stairs:          shift + .")
-            console.print(x=frame_x + 1, y=frame_y + 7, string="Movement:              Numpad keys")
-            console.print(x=frame_x + 1, y=frame_y + 8, string="Wait:                     Numpad 5")
-
-            frame_x = setup_game.WINDOW_WIDTH * 2 // 3 + 1
-            frame_y = setup_game.WINDOW_HEIGHT * 2 // 3 + 1
-            console.draw_frame(
-                x=frame_x,
-                y=frame_y,
-                width=setup_game.WINDOW_WIDTH // 3 - 1,
-                height=setup_game.WINDOW_HEIGHT // 3 - 2,
-                title="Map Legend",
-                clear=True,
-                fg=(255, 255, 255),
-                bg=(0, 0, 0),
+                console=console, x=0, y=hud_y + 7, engine=self
             )
 
-            console.print(x=frame_x + 1, y=frame_y + 1, string="@: Player / Trader")
-            console.print(x=frame_x + 1, y=frame_y + 2, string=">: Stairs down")
-            console.print(x=frame_x + 1, y=frame_y + 3, string="/: Weapon")
-            console.print(x=frame_x + 1, y=frame_y + 4, string="[: Armor")
-            console.print(x=frame_x + 1, y=frame_y + 5, string="!: Potion")
-            console.print(x=frame_x + 1, y=frame_y + 6, string="~: Scroll")
+            # The keyboard commands and map legend never change, so they are drawn once and copied every frame.
+            panel_width = third_width - 1
+            panel_height = setup_game.WINDOW_HEIGHT // 3 - 2
+            render_functions.prerender_panel(
+                "Keyboard Commands", KEYBOARD_COMMANDS, panel_width, panel_height
+            ).blit(console, dest_x=third_width + 1, dest_y=hud_y + 1)
+            render_functions.prerender_panel(
+                "Map Legend", MAP_LEGEND, panel_width, panel_height
+            ).blit(console, dest_x=two_thirds_width + 1, dest_y=hud_y + 1)
 
     def update_fov(self) -> None:
         """Recompute the visible area based on the player's point of view."""
-        self.game_map.visible[:] = compute_fov(
+        # compute_fov returns a new array and nothing else holds on to the old one, so take it instead of
+        # copying it over the old array.
+        self.game_map.visible = compute_fov(
             self.game_map.tiles["transparent"],
             (self.player.x, self.player.y),
             radius=8,
@@ -47,7 +47,7 @@ class Entity:
         if parent:
             # If parent isn't provided now then it will be set later
             self.parent = parent
-            parent.entities.add(self)
+            parent.add_entity(self)
 
     @property
     def game_map(self) -> GameMap:
@@ -61,28 +61,43 @@ class Entity:
         clone.x = x
         clone.y = y
         clone.parent = game_map
-        game_map.entities.add(clone)
+        game_map.add_entity(clone)
         return clone
 
     def place(self, x: int, y: int, game_map: Optional[GameMap] = None) -> None:
         """Place this entity at a new location. Handles moving across GameMaps."""
+        if hasattr(self, "parent"):  # Possibly uninitialized
+            if self.parent is self.game_map:
+                # Take the entity off its current map, so it is re-indexed at its new location.
+                self.parent.remove_entity(self)
+                if not game_map:
+                    game_map = self.parent
         self.x = x
         self.y = y
         if game_map:
-            if hasattr(self, "parent"):  # Possibly uninitialized
-                if self.parent is self.game_map:
-                    self.parent.entities.remove(self)
             self.parent = game_map
-            game_map.entities.add(self)
+            game_map.add_entity(self)
 
     def distance(self, x: int, y: int) -> float:
         """
         Return the distance between the current entity and the given (x, y) coordinate.
         """
-        return math.sqrt((x - self.x) ** 2 + (y - self.y) ** 2)
+        return math.sqrt(self.distance_sq(x, y))
+
+    def distance_sq(self, x: int, y: int) -> int:
+        """
+        Return the squared distance between the current entity and the given (x, y) coordinate.
+
+        Orders coordinates the same way as distance, without the square root, so use it for comparisons.
+        """
+        dx = x - self.x
+        dy = y - self.y
+        return dx * dx + dy * dy
 
     def move(self, dx: int, dy: int) -> None:
         # Move the entity by a given amount
+        if self.blocks_movement:
+            self.game_map.move_blocker(self, self.x + dx, self.y + dy)
         self.x += dx
         self.y += dy
 
@@ -119,6 +134,7 @@ class Actor(Entity):
 
         self.fighter = fighter
         self.fighter.parent = self
+        self.fighter.update_combat_stats()  # Account for any items the equipment started with
 
         self.inventory = inventory
         self.inventory.parent = self
@@ -1,3 +1,4 @@
+import color
 from components.ai import HostileEnemy
 from components import consumable, equippable
 from components.equipment import Equipment
@@ -18,7 +19,8 @@ player = Actor(
     ai_cls=HostileEnemy,
     equipment=Equipment(items=None),
     fighter=Fighter(
-        strength=1, perseverance=1, agility=1, magic=1, hit_dice="2d10", hp=30, base_defense=1, base_power=2, mana=20
+        strength=1, perseverance=1, agility=1, magic=1, hit_dice="2d10", hp=30, base_defense=1, base_power=2, mana=20,
+        attack_color=color.player_atk,
     ),
     inventory=Inventory(capacity=26),
     level=Level(level_up_base=200),
@@ -1,16 +1,11 @@
-from enum import auto, Enum
+from enum import IntEnum
 
 
-class EquipmentSlot(Enum):
-    HEAD = auto()
-    ARMOR = auto()
-    MAINHAND = auto()
-    OFFHAND = auto()
-    TRINKET1 = auto()
-    TRINKET2 = auto()
-
-    def __lt__(self, other):
-        if not hasattr(other, 'value'):
-            return NotImplemented
-        else:
-            return self.value < other.value
+class EquipmentSlot(IntEnum):
+    # Values are dense and start at 0 so a slot can index Equipment.items directly.
+    HEAD = 0
+    ARMOR = 1
+    MAINHAND = 2
+    OFFHAND = 3
+    TRINKET1 = 4
+    TRINKET2 = 5
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Iterable, Iterator, Optional, TYPE_CHECKING
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TYPE_CHECKING
 
 import numpy as np  # type: ignore
 from tcod.console import Console
@@ -19,8 +19,18 @@ class GameMap:
     ):
         self.engine = engine
         self.width, self.height = width, height
-        self.entities = set(entities)
+        self.entities: Set[Entity] = set()
+        # Items on the floor, keyed by their location, so pickups don't scan every entity.
+        self.items_by_tile: Dict[Tuple[int, int], List[Item]] = {}
+        # Entities that block movement, keyed by their location. Only one can occupy a tile.
+        self.blocker_at: Dict[Tuple[int, int], Entity] = {}
+        # Every actor on this map except the player, dead or alive, so enemy turns don't build a set each turn.
+        self.non_player_actors: List[Actor] = []
+        for entity in entities:
+            self.add_entity(entity)
         self.tiles = np.full((width, height), fill_value=tile_types.wall, order="F")
+        # A view of the tiles' walkable field, so movement checks skip the structured field lookup.
+        self.walkable = self.tiles["walkable"]
 
         self.visible = np.full(
             (width, height), fill_value=False, order="F"
@@ -31,6 +41,25 @@ class GameMap:
 
         self.downstairs_location = (0, 0)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the map without its redundant or oversized arrays."""
+        state = self.__dict__.copy()
+        # Pickling the walkable view would store a separate copy of the field; it's recreated from the tiles instead.
+        del state["walkable"]
+        # Boolean arrays pickle as a byte per tile, so pack them into bits.
+        state["visible"] = np.packbits(self.visible.ravel(order="F"))
+        state["explored"] = np.packbits(self.explored.ravel(order="F"))
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.walkable = self.tiles["walkable"]
+        shape = (self.width, self.height)
+        self.visible = np.unpackbits(self.visible, count=self.width * self.height).view(bool).reshape(shape, order="F")
+        self.explored = np.unpackbits(self.explored, count=self.width * self.height).view(bool).reshape(
+            shape, order="F"
+        )
+
     @property
     def game_map(self) -> GameMap:
         return self
@@ -48,23 +77,54 @@ class GameMap:
     def items(self) -> Iterator[Item]:
         yield from (entity for entity in self.entities if isinstance(entity, Item))
 
+    def add_entity(self, entity: Entity) -> None:
+        """Add an entity to this map and index it by its current location."""
+        self.entities.add(entity)
+        if isinstance(entity, Actor) and entity is not self.engine.player:
+            self.non_player_actors.append(entity)
+        if isinstance(entity, Item):
+            self.items_by_tile.setdefault((entity.x, entity.y), []).append(entity)
+        if entity.blocks_movement:
+            self.blocker_at[entity.x, entity.y] = entity
+
+    def remove_entity(self, entity: Entity) -> None:
+        """Remove an entity from this map and from the location index."""
+        self.entities.remove(entity)
+        if isinstance(entity, Actor) and entity is not self.engine.player:
+            self.non_player_actors.remove(entity)
+        if isinstance(entity, Item):
+            location = (entity.x, entity.y)
+            items = self.items_by_tile[location]
+            items.remove(entity)
+            if not items:
+                del self.items_by_tile[location]
+        if entity.blocks_movement:
+            self.unblock(entity)
+
+    def move_blocker(self, entity: Entity, x: int, y: int) -> None:
+        """Re-index a blocking entity that is about to move to (x, y)."""
+        del self.blocker_at[entity.x, entity.y]
+        self.blocker_at[x, y] = entity
+
+    def unblock(self, entity: Entity) -> None:
+        """Drop an entity from the blocker index, e.g. when it stops blocking movement."""
+        if self.blocker_at.get((entity.x, entity.y)) is entity:
+            del self.blocker_at[entity.x, entity.y]
+
+    def get_items_at_location(self, x: int, y: int) -> List[Item]:
+        """Return the items lying on the given tile."""
+        return self.items_by_tile.get((x, y), [])
+
     def get_blocking_entity_at_location(
             self, location_x: int, location_y: int,
     ) -> Optional[Entity]:
-        for entity in self.entities:
-            if (
-                entity.blocks_movement
-                and entity.x == location_x
-                and entity.y == location_y
-            ):
-                return entity
-
-        return None
+        return self.blocker_at.get((location_x, location_y))
 
     def get_actor_at_location(self, x: int, y: int) -> Optional[Actor]:
-        for actor in self.actors:
-            if actor.x == x and actor.y == y:
-                return actor
+        # Living actors always block movement, so the blocker index covers them.
+        entity = self.blocker_at.get((x, y))
+        if isinstance(entity, Actor) and entity.is_alive:
+            return entity
 
         return None
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import os.path
 import time
 from typing import Callable, List, Optional, Tuple, TYPE_CHECKING, Union
@@ -131,10 +132,12 @@ class EventHandler(BaseEventHandler):
             return False
 
         try:
-            action.perform()
+            reason = action.perform()
         except exceptions.Impossible as exc:
-            self.engine.message_log.add_message(exc.args[0], color.impossible)
-            return False  # Skip enemy turn on exceptions.
+            reason = exc.args[0]
+        if reason is not None:
+            self.engine.message_log.add_message(reason, color.impossible)
+            return False  # Skip enemy turn on impossible actions.
 
         self.engine.handle_enemy_turns()
 
@@ -656,7 +659,7 @@ class HistoryViewer(EventHandler):
             1,
             log_console.width - 2,
             log_console.height - 2,
-            self.engine.message_log.messages[: self.cursor + 1],
+            list(itertools.islice(self.engine.message_log.messages, self.cursor + 1)),
         )
         log_console.blit(console, 3, 3)
 
@@ -869,7 +872,7 @@ class EquipmentEventHandler(AskUserEventHandler):
                 self.cursor += adjust
         elif key in CONFIRM_KEYS:
             try:
-                selected_item = EquipmentSlot(self.cursor + 1)
+                selected_item = EquipmentSlot(self.cursor)
             except IndexError:
                 self.engine.message_log.add_message("Invalid entry.", color.invalid)
                 return None
@@ -1192,8 +1195,8 @@ class ClassSelectEventHandler(BaseEventHandler):
 
 def load_game(filename: str) -> Engine:
     """Load an engine instance from a file."""
-    with open(filename, "rb") as f:
-        engine = pickle.loads(lzma.decompress(f.read()))
+    with lzma.open(filename, "rb") as f:
+        engine = pickle.load(f)
     assert isinstance(engine, Engine)
     return engine
 
@@ -1,4 +1,5 @@
-from typing import Iterable, List, Reversible, Tuple
+from collections import deque
+from typing import Deque, Iterable, Reversible, Tuple
 import textwrap
 
 import tcod
@@ -20,9 +21,13 @@ class Message:
         return self.plain_text
 
 
+MAX_MESSAGES = 500
+
+
 class MessageLog:
     def __init__(self) -> None:
-        self.messages: List[Message] = []
+        # Once full, the oldest message is dropped whenever a new one is added.
+        self.messages: Deque[Message] = deque(maxlen=MAX_MESSAGES)
 
     def add_message(
             self, text: str, fg: Tuple[int, int, int] = color.white, *, stack: bool = True,
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Tuple, TYPE_CHECKING
 
+from tcod.console import Console
+
 import color
 import setup_game
 from components.fighter import Fighter
 
 if TYPE_CHECKING:
-    from tcod import Console
     from engine import Engine
     from game_map import GameMap
 
@@ -89,3 +91,27 @@ def render_names_at_mouse_location(
     )
 
     console.print(x=x, y=y, string=names_at_mouse_location)
+
+
+@lru_cache(maxsize=None)
+def prerender_panel(title: str, lines: Tuple[str, ...], width: int, height: int) -> Console:
+    """
+    Draw a framed panel of text that never changes onto its own console, once.
+
+    The result is shared between calls, so blit it instead of drawing on it.
+    """
+    panel = Console(width, height, order="F")
+    panel.draw_frame(
+        x=0,
+        y=0,
+        width=width,
+        height=height,
+        title=title,
+        clear=True,
+        fg=(255, 255, 255),
+        bg=(0, 0, 0),
+    )
+
+    panel.print(x=1, y=1, string="\n".join(lines))
+
+    return panel